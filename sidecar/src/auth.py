@@ -5,14 +5,17 @@ Handles:
   - Exchanging the auth code for tokens
   - Persisting tokens in SQLite
   - Auto-refreshing expired access tokens
+  - Caching the live Credentials object in-process between refreshes
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime, timezone
+import threading
+from datetime import datetime, timedelta, timezone
 
+from google.auth import _helpers as google_auth_helpers
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
@@ -21,6 +24,22 @@ from . import config
 
 log = logging.getLogger(__name__)
 
+# Refresh this long before the access token actually expires. google-auth
+# already treats a token as invalid (and the transport refreshes it inline)
+# REFRESH_THRESHOLD before expiry, so our window must open earlier than that.
+_EXPIRY_SKEW = google_auth_helpers.REFRESH_THRESHOLD + timedelta(seconds=60)
+
+# (refresh_token, credentials) from the last successful load or refresh.
+_CREDS_CACHE: tuple[str, Credentials] | None = None
+
+# Set once the database is found to hold no refresh token, so unauthenticated
+# polls skip the lookup until /auth/callback stores one and calls invalidate().
+_NO_AUTH_UNTIL_INVALIDATED = False
+
+# Serialises refreshes between the poller's background refresher and any
+# request thread that finds the token stale.
+_REFRESH_LOCK = threading.Lock()
+
 
 def _make_client_config() -> dict:
     return {
@@ -66,32 +85,92 @@ def exchange_code(code: str) -> dict:
     }
 
 
-def load_credentials(db) -> Credentials | None:
-    """Load credentials from the database and refresh if expired.
+def invalidate() -> None:
+    """Drop cached credentials and any cached "not authenticated" result.
 
-    Returns a valid Credentials object, or None if no tokens are stored.
-    Automatically persists refreshed tokens back to the database.
+    Call after storing fresh tokens (e.g. once OAuth completes). Taking the
+    refresh lock means a load or refresh already in flight finishes first,
+    so it can't re-populate either cache from the old state afterwards.
     """
-    refresh_token = db.get_auth("refresh_token")
-    if not refresh_token:
+    global _CREDS_CACHE, _NO_AUTH_UNTIL_INVALIDATED
+    with _REFRESH_LOCK:
+        _CREDS_CACHE = None
+        _NO_AUTH_UNTIL_INVALIDATED = False
+
+
+def _is_fresh(creds: Credentials) -> bool:
+    """True if the access token is valid for at least another _EXPIRY_SKEW."""
+    if not creds.token:
+        return False
+    if creds.expiry is None:
+        return True
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now > _EXPIRY_SKEW
+
+
+def seconds_until_refresh() -> float | None:
+    """Seconds until the cached token enters the refresh window.
+
+    Returns None if no credentials have been loaded yet.
+    """
+    if _CREDS_CACHE is None:
+        return None
+    expiry = _CREDS_CACHE[1].expiry
+    if expiry is None:
         return None
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (expiry - now - _EXPIRY_SKEW).total_seconds()
 
-    access_token = db.get_auth("access_token")
-    expiry_raw = db.get_auth("token_expiry")
-    expiry = datetime.fromisoformat(expiry_raw) if expiry_raw else None
 
-    creds = Credentials(
-        token=access_token,
-        refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=config.GOOGLE_CLIENT_ID,
-        client_secret=config.GOOGLE_CLIENT_SECRET,
-        scopes=config.SCOPES,
-    )
-    if expiry:
-        creds.expiry = expiry
+def load_credentials(db) -> Credentials | None:
+    """Load credentials from the database and refresh if expired.
 
-    if creds.expired or not creds.valid:
+    Returns a valid Credentials object, or None if no tokens are stored.
+    Automatically persists refreshed tokens back to the database.  The
+    result is cached in-process, so the database is only consulted again
+    once the access token is about to expire or after invalidate().
+    """
+    if _NO_AUTH_UNTIL_INVALIDATED:
+        return None
+    cached = _CREDS_CACHE
+    if cached is not None and _is_fresh(cached[1]):
+        return cached[1]
+
+    with _REFRESH_LOCK:
+        return _load_or_refresh(db)
+
+
+def _load_or_refresh(db) -> Credentials | None:
+    global _CREDS_CACHE, _NO_AUTH_UNTIL_INVALIDATED
+
+    # Another thread may have refreshed while we waited for the lock.
+    if _CREDS_CACHE is not None:
+        refresh_token, creds = _CREDS_CACHE
+        if _is_fresh(creds):
+            return creds
+    else:
+        refresh_token = db.get_auth("refresh_token")
+        if not refresh_token:
+            _NO_AUTH_UNTIL_INVALIDATED = True
+            return None
+
+        access_token = db.get_auth("access_token")
+        expiry_raw = db.get_auth("token_expiry")
+        expiry = datetime.fromisoformat(expiry_raw) if expiry_raw else None
+
+        creds = Credentials(
+            token=access_token,
+            refresh_token=refresh_token,
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id=config.GOOGLE_CLIENT_ID,
+            client_secret=config.GOOGLE_CLIENT_SECRET,
+            scopes=config.SCOPES,
+        )
+        if expiry:
+            creds.expiry = expiry
+
+    if not _is_fresh(creds):
         log.info("Access token expired, refreshing...")
         creds.refresh(Request())
         db.set_auth("access_token", creds.token)
@@ -99,4 +178,5 @@ def load_credentials(db) -> Credentials | None:
             db.set_auth("token_expiry", creds.expiry.isoformat())
         log.info("Token refreshed successfully.")
 
+    _CREDS_CACHE = (refresh_token, creds)
     return creds
@@ -7,31 +7,68 @@ and user OAuth credentials.
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
-from typing import Any
+import threading
+from datetime import datetime
+from typing import Any, Iterator
 
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 from . import config
 from .auth import load_credentials
 
 log = logging.getLogger(__name__)
 
+# Socket timeout (seconds) for Chat API calls
+HTTP_TIMEOUT = 15
+
+# Partial-response masks: only request the fields _normalize and
+# get_space_info actually read. The Chat API's User resource has no email
+# field, so sender_email is always empty and isn't requested.
+MESSAGE_FIELDS = "name,sender/displayName,text,createTime"
+LIST_FIELDS = f"nextPageToken,messages({MESSAGE_FIELDS})"
+SPACE_FIELDS = "name,displayName,spaceType"
+
+# Built services are cached per thread: the underlying httplib2.Http keeps
+# connections to chat.googleapis.com open between calls but is not safe to
+# share across the poller thread and request threads.
+_local = threading.local()
+
 
 def _get_service(db):
-    """Build and return an authenticated Chat API service."""
+    """Return an authenticated Chat API service, building it on first use.
+
+    The service is rebuilt only when auth hands back a different
+    Credentials object (e.g. after re-running the OAuth flow).
+    """
     creds = load_credentials(db)
     if creds is None:
         raise RuntimeError(
             "Not authenticated. Complete the OAuth flow via /auth/url first."
         )
-    return build("chat", "v1", credentials=creds)
+    if getattr(_local, "creds", None) is not creds:
+        http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        _local.service = build(
+            "chat",
+            "v1",
+            http=http,
+            cache_discovery=False,
+            static_discovery=True,
+        )
+        _local.creds = creds
+    return _local.service
 
 
 def get_space_info(db) -> dict[str, Any]:
     """Return metadata for the configured space."""
     svc = _get_service(db)
-    space = svc.spaces().get(name=config.GOOGLE_CHAT_SPACE_ID).execute()
+    space = (
+        svc.spaces()
+        .get(name=config.GOOGLE_CHAT_SPACE_ID, fields=SPACE_FIELDS)
+        .execute()
+    )
     return {
         "name": space.get("name"),
         "display_name": space.get("displayName"),
@@ -39,51 +76,118 @@ def get_space_info(db) -> dict[str, Any]:
     }
 
 
-def list_messages(
+def iter_message_pages(
     db,
     *,
-    after: datetime | None = None,
+    after: str | None = None,
     page_size: int = 100,
-) -> list[dict[str, Any]]:
-    """Fetch messages from the configured space.
+    etag: str | None = None,
+) -> MessagePages:
+    """Fetch messages from the configured space, one page at a time.
 
     Args:
-        after: Only return messages created after this timestamp.
+        after: Only return messages created after this RFC 3339 timestamp,
+            e.g. a createTime previously returned by the API.
         page_size: Max messages per page (Google caps at 1000).
+        etag: ETag of the previous call's first page, sent as If-None-Match.
 
-    Returns a list of normalised message dicts, oldest first.
+    Returns an iterable of lists of normalised message dicts, in the order
+    the API returns them; callers that need a particular order should sort
+    at the sink. A 304 Not Modified yields nothing.
     """
-    svc = _get_service(db)
-    all_messages: list[dict[str, Any]] = []
-    page_token: str | None = None
-
-    # Google Chat API filter for messages after a timestamp
-    filter_str = ""
-    if after:
-        ts = after.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-        filter_str = f'createTime > "{ts}"'
-
-    while True:
-        kwargs: dict[str, Any] = {
-            "parent": config.GOOGLE_CHAT_SPACE_ID,
-            "pageSize": min(page_size, 1000),
-        }
-        if filter_str:
-            kwargs["filter"] = filter_str
-        if page_token:
-            kwargs["pageToken"] = page_token
-
-        resp = svc.spaces().messages().list(**kwargs).execute()
-        for msg in resp.get("messages", []):
-            all_messages.append(_normalize(msg))
-
-        page_token = resp.get("nextPageToken")
-        if not page_token:
-            break
-
-    # API returns newest first; reverse so oldest is first
-    all_messages.reverse()
-    return all_messages
+    return MessagePages(db, after=after, page_size=page_size, etag=etag)
+
+
+class MessagePages:
+    """Pages of new messages from one (conditional) messages.list call.
+
+    Once iterated, `etag` holds the first page's ETag, or the one passed
+    in if the server answered 304 or sent none. It is not persisted here:
+    the caller should store it only after every page has been ingested,
+    otherwise a failed poll would be answered with 304 on retry.
+    """
+
+    def __init__(self, db, *, after: str | None, page_size: int, etag: str | None):
+        self._db = db
+        self._after = after
+        self._page_size = page_size
+        self.etag = etag
+
+    def __iter__(self) -> Iterator[list[dict[str, Any]]]:
+        svc = _get_service(self._db)
+        page_token: str | None = None
+
+        # Google Chat API filter for messages after a timestamp
+        after = self._after
+        filter_str = f'createTime > "{after}"' if after else ""
+        after_dt = datetime.fromisoformat(after) if after else None
+
+        while True:
+            kwargs: dict[str, Any] = {
+                "parent": config.GOOGLE_CHAT_SPACE_ID,
+                "pageSize": min(self._page_size, 1000),
+                "fields": LIST_FIELDS,
+            }
+            if filter_str:
+                kwargs["filter"] = filter_str
+            if page_token:
+                kwargs["pageToken"] = page_token
+
+            request = svc.spaces().messages().list(**kwargs)
+            if page_token:
+                resp = request.execute()
+            else:
+                resp, new_etag = _execute_conditional(request, self.etag)
+                if resp is None:
+                    return
+                if new_etag:
+                    self.etag = new_etag
+            page = [_normalize(msg) for msg in resp.get("messages", [])]
+            if after_dt:
+                fresh = [
+                    m for m in page
+                    if datetime.fromisoformat(m["created_at"]) > after_dt
+                ]
+            else:
+                fresh = page
+            if fresh:
+                yield fresh
+
+            page_token = resp.get("nextPageToken")
+            if not page_token:
+                break
+            if len(fresh) < len(page):
+                # The filter should already exclude these; stop rather than
+                # paging back through history we have already stored.
+                break
+
+
+def _execute_conditional(
+    request, etag: str | None
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Execute `request` with If-None-Match set to `etag`.
+
+    Returns (body, response ETag); body is None if the server answered 304.
+    """
+    if etag:
+        request.headers["If-None-Match"] = etag
+
+    # execute() only returns the body; grab the headers on the way through
+    postproc = request.postproc
+    seen: dict[str, str | None] = {}
+
+    def capture(resp, content):
+        seen["etag"] = resp.get("etag")
+        return postproc(resp, content)
+
+    request.postproc = capture
+    try:
+        body = request.execute()
+    except HttpError as exc:
+        if exc.resp.status == 304:
+            return None, etag
+        raise
+    return body, seen.get("etag")
 
 
 def send_message(db, text: str) -> dict[str, Any]:
@@ -98,6 +202,7 @@ def send_message(db, text: str) -> dict[str, Any]:
         .create(
             parent=config.GOOGLE_CHAT_SPACE_ID,
             body={"text": text},
+            fields=MESSAGE_FIELDS,
         )
         .execute()
     )
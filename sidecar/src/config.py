@@ -17,9 +17,14 @@ SIDECAR_PORT = int(os.environ.get("SIDECAR_PORT", "3100"))
 
 # Polling intervals (seconds)
 POLL_ACTIVE_INTERVAL = int(os.environ.get("POLL_ACTIVE_INTERVAL", "30"))
+# ACTIVE polls back off towards this while they keep finding nothing new
+POLL_ACTIVE_MAX_INTERVAL = int(os.environ.get("POLL_ACTIVE_MAX_INTERVAL", "120"))
 POLL_IDLE_INTERVAL = int(os.environ.get("POLL_IDLE_INTERVAL", "14400"))  # 4 hours
 POLL_DECAY_TIMEOUT = int(os.environ.get("POLL_DECAY_TIMEOUT", "600"))  # 10 minutes
 
+# Delete messages older than this many days (0 keeps them forever)
+MESSAGE_RETENTION_DAYS = int(os.environ.get("MESSAGE_RETENTION_DAYS", "0"))
+
 # SQLite database path — should be on a Docker volume for persistence
 DB_PATH = os.environ.get("DB_PATH", "/data/google_chat.db")
 
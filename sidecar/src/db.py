@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import queue
 import sqlite3
 import logging
-from datetime import datetime, timezone
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from . import config
 
 log = logging.getLogger(__name__)
 
+# Read-only connections shared by request handlers. WAL lets these read
+# concurrently with the single writer connection.
+READER_POOL_SIZE = 4
+
+PRAGMAS = """
+PRAGMA auto_vacuum = INCREMENTAL;
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -20000;
+PRAGMA mmap_size = 268435456;
+"""
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS messages (
     id TEXT PRIMARY KEY,
@@ -24,6 +40,25 @@ CREATE TABLE IF NOT EXISTS messages (
 
 CREATE INDEX IF NOT EXISTS idx_messages_created_at ON messages(created_at);
 
+-- Full-text index over messages, kept in sync by the triggers below
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    id UNINDEXED,
+    sender_name,
+    text,
+    content='messages',
+    content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, id, sender_name, text)
+    VALUES (new.rowid, new.id, new.sender_name, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, id, sender_name, text)
+    VALUES ('delete', old.rowid, old.id, old.sender_name, old.text);
+END;
+
 CREATE TABLE IF NOT EXISTS state (
     key TEXT PRIMARY KEY,
     value TEXT NOT NULL
@@ -36,43 +71,180 @@ CREATE TABLE IF NOT EXISTS auth (
 """
 
 
+# Seed the counters kept up to date by upsert_messages, for databases that
+# predate them. No-op once the rows exist.
+SEED_COUNTERS = """
+INSERT OR IGNORE INTO state (key, value)
+    SELECT 'total_count', COUNT(*) FROM messages;
+"""
+
+
 class Database:
-    """Thin wrapper around SQLite with methods for messages, state, and auth."""
+    """Thin wrapper around SQLite with methods for messages, state, and auth.
+
+    Writes go through a single connection guarded by a lock; reads check
+    out one of a small pool of read-only connections.
+    """
 
     def __init__(self, db_path: str | None = None):
         path = db_path or config.DB_PATH
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-        self.conn.executescript(SCHEMA)
+        self._writer = _connect(path)
+        has_fts = self._writer.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'"
+        ).fetchone()
+        self._writer.executescript(SCHEMA)
+        if not has_fts:
+            # Index any messages stored before the FTS table existed
+            self._writer.execute(
+                "INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')"
+            )
+            self._writer.commit()
+        self._writer.executescript(SEED_COUNTERS)
+        self._seed_latest_created_at()
+        self._write_lock = threading.Lock()
+
+        # Memoised state/auth rows (None for missing keys). Every write to
+        # these tables goes through this object, which keeps them current.
+        self._cache_lock = threading.Lock()
+        self._state_cache: dict[str, str | None] = {}
+        self._auth_cache: dict[str, str | None] = {}
+
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(READER_POOL_SIZE):
+            reader = _connect(path)
+            reader.execute("PRAGMA query_only = 1")
+            self._readers.put(reader)
         log.info("Database initialised at %s", path)
 
+    def _seed_latest_created_at(self) -> None:
+        """Seed latest_created_at for databases that predate it.
+
+        Such databases also predate the poller's last_created_at cursor,
+        which is seeded from the same value so polling resumes from the
+        newest stored message rather than re-listing the whole space.
+
+        createTime strings carry 0, 3, 6 or 9 fractional digits, so they
+        don't sort correctly as text; compare them as datetimes instead.
+        """
+        if self._writer.execute(
+            "SELECT 1 FROM state WHERE key = 'latest_created_at'"
+        ).fetchone():
+            return
+        rows = self._writer.execute("SELECT created_at FROM messages")
+        latest = max(
+            (row["created_at"] for row in rows),
+            key=datetime.fromisoformat,
+            default=None,
+        )
+        if latest:
+            with self._writer:
+                self._writer.execute(
+                    "INSERT INTO state (key, value) VALUES ('latest_created_at', ?)",
+                    (latest,),
+                )
+                self._writer.execute(
+                    """INSERT OR IGNORE INTO state (key, value)
+                       VALUES ('last_created_at', ?)""",
+                    (latest,),
+                )
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a read-only connection, blocking if all are in use."""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
     # -- messages --
 
-    def upsert_messages(self, messages: list[dict[str, Any]]) -> int:
-        """Insert messages, skipping duplicates. Returns count of new rows."""
+    def upsert_messages(
+        self, messages: list[dict[str, Any]]
+    ) -> tuple[int, str | None]:
+        """Insert messages, skipping duplicates.
+
+        Returns the count of new rows and the newest created_at in the
+        batch (None if the batch is empty).
+        """
         now = datetime.now(timezone.utc).isoformat()
-        inserted = 0
-        for msg in messages:
-            try:
-                self.conn.execute(
+        rows = [
+            (
+                msg["id"],
+                msg["sender_name"],
+                msg.get("sender_email", ""),
+                msg["text"],
+                msg["created_at"],
+                now,
+            )
+            for msg in messages
+        ]
+        newest = max(
+            (row[4] for row in rows), key=datetime.fromisoformat, default=None
+        )
+        with self._write_lock:
+            with self._writer:
+                cur = self._writer.executemany(
                     """INSERT OR IGNORE INTO messages
                        (id, sender_name, sender_email, text, created_at, fetched_at)
                        VALUES (?, ?, ?, ?, ?, ?)""",
-                    (
-                        msg["id"],
-                        msg["sender_name"],
-                        msg.get("sender_email", ""),
-                        msg["text"],
-                        msg["created_at"],
-                        now,
-                    ),
+                    rows,
+                )
+                # rowcount sums changes across the batch; ignored duplicates count 0
+                inserted = cur.rowcount
+                if inserted > 0:
+                    self._writer.execute(
+                        """INSERT INTO state (key, value) VALUES ('total_count', ?)
+                           ON CONFLICT(key) DO UPDATE
+                           SET value = CAST(value AS INTEGER) + excluded.value""",
+                        (inserted,),
+                    )
+                    # Compared as datetimes, not text: createTime strings
+                    # vary in their number of fractional digits
+                    row = self._writer.execute(
+                        "SELECT value FROM state WHERE key = 'latest_created_at'"
+                    ).fetchone()
+                    if row is None or (
+                        datetime.fromisoformat(newest)
+                        > datetime.fromisoformat(row["value"])
+                    ):
+                        self._writer.execute(
+                            """INSERT OR REPLACE INTO state (key, value)
+                               VALUES ('latest_created_at', ?)""",
+                            (newest,),
+                        )
+            if inserted > 0:
+                self._reload_state("total_count", "latest_created_at")
+        return inserted, newest
+
+    def prune(self, older_than_days: int) -> int:
+        """Delete messages created more than `older_than_days` ago.
+
+        Returns the number of rows deleted.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        with self._write_lock:
+            with self._writer:
+                cur = self._writer.execute(
+                    "DELETE FROM messages WHERE created_at < ?",
+                    (cutoff.strftime("%Y-%m-%dT%H:%M:%SZ"),),
                 )
-                inserted += self.conn.total_changes  # rough; good enough
-            except sqlite3.IntegrityError:
-                pass
-        self.conn.commit()
-        return inserted
+                deleted = cur.rowcount
+                if deleted > 0:
+                    self._writer.execute(
+                        """UPDATE state SET value = CAST(value AS INTEGER) - ?
+                           WHERE key = 'total_count'""",
+                        (deleted,),
+                    )
+            # Hand freed pages back to the filesystem (no-op unless the
+            # database was created with auto_vacuum = INCREMENTAL). Run via
+            # executescript: execute() only steps the pragma once, which
+            # frees a single page.
+            if deleted > 0:
+                self._writer.executescript("PRAGMA incremental_vacuum;")
+                self._reload_state("total_count")
+        return deleted
 
     def get_messages(
         self,
@@ -89,15 +261,22 @@ class Database:
             clauses.append("created_at > ?")
             params.append(since)
         if sender:
-            clauses.append("sender_name LIKE ?")
-            params.append(f"%{sender}%")
+            sender_query = _fts_prefix_query(sender)
+            if not sender_query:
+                # Whitespace only; no sender name can match it
+                return []
+            clauses.append(
+                "rowid IN (SELECT rowid FROM messages_fts WHERE sender_name MATCH ?)"
+            )
+            params.append(sender_query)
 
         where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         params.append(limit)
-        rows = self.conn.execute(
-            f"SELECT * FROM messages {where} ORDER BY created_at ASC LIMIT ?",
-            params,
-        ).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM messages {where} ORDER BY created_at ASC LIMIT ?",
+                params,
+            ).fetchall()
         return [dict(r) for r in rows]
 
     def get_unread_messages(self) -> list[dict[str, Any]]:
@@ -115,54 +294,99 @@ class Database:
         return ts
 
     def message_count(self) -> int:
-        row = self.conn.execute("SELECT COUNT(*) AS cnt FROM messages").fetchone()
-        return row["cnt"]
+        return int(self.get_state("total_count") or 0)
 
     def latest_message_time(self) -> str | None:
-        row = self.conn.execute(
-            "SELECT created_at FROM messages ORDER BY created_at DESC LIMIT 1"
-        ).fetchone()
-        return row["created_at"] if row else None
+        return self.get_state("latest_created_at")
 
     def unread_count(self) -> int:
         marker = self.get_state("read_marker")
         if marker:
-            row = self.conn.execute(
-                "SELECT COUNT(*) AS cnt FROM messages WHERE created_at > ?",
-                (marker,),
-            ).fetchone()
-        else:
-            row = self.conn.execute(
-                "SELECT COUNT(*) AS cnt FROM messages"
-            ).fetchone()
-        return row["cnt"]
+            with self._reader() as conn:
+                row = conn.execute(
+                    "SELECT COUNT(*) AS cnt FROM messages WHERE created_at > ?",
+                    (marker,),
+                ).fetchone()
+            return row["cnt"]
+        return self.message_count()
 
     # -- key-value state --
 
     def get_state(self, key: str) -> str | None:
-        row = self.conn.execute(
-            "SELECT value FROM state WHERE key = ?", (key,)
-        ).fetchone()
-        return row["value"] if row else None
+        try:
+            return self._state_cache[key]
+        except KeyError:
+            pass
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT value FROM state WHERE key = ?", (key,)
+            ).fetchone()
+        # Don't clobber a value a concurrent writer stored after our read
+        with self._cache_lock:
+            return self._state_cache.setdefault(key, row["value"] if row else None)
 
     def set_state(self, key: str, value: str) -> None:
-        self.conn.execute(
-            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
-            (key, value),
-        )
-        self.conn.commit()
+        with self._write_lock:
+            self._writer.execute(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+            self._writer.commit()
+            with self._cache_lock:
+                self._state_cache[key] = value
+
+    def _reload_state(self, *keys: str) -> None:
+        """Refresh memoised state rows that were changed by SQL.
+
+        Must be called with the write lock held, after the commit.
+        """
+        for key in keys:
+            row = self._writer.execute(
+                "SELECT value FROM state WHERE key = ?", (key,)
+            ).fetchone()
+            with self._cache_lock:
+                self._state_cache[key] = row["value"] if row else None
 
     # -- auth tokens --
 
     def get_auth(self, key: str) -> str | None:
-        row = self.conn.execute(
-            "SELECT value FROM auth WHERE key = ?", (key,)
-        ).fetchone()
-        return row["value"] if row else None
+        try:
+            return self._auth_cache[key]
+        except KeyError:
+            pass
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT value FROM auth WHERE key = ?", (key,)
+            ).fetchone()
+        # Don't clobber a value a concurrent writer stored after our read
+        with self._cache_lock:
+            return self._auth_cache.setdefault(key, row["value"] if row else None)
 
     def set_auth(self, key: str, value: str) -> None:
-        self.conn.execute(
-            "INSERT OR REPLACE INTO auth (key, value) VALUES (?, ?)",
-            (key, value),
-        )
-        self.conn.commit()
+        with self._write_lock:
+            self._writer.execute(
+                "INSERT OR REPLACE INTO auth (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+            self._writer.commit()
+            with self._cache_lock:
+                self._auth_cache[key] = value
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open a connection with the shared pragmas applied."""
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    # WAL lets /messages and /status read while the poller commits
+    conn.executescript(PRAGMAS)
+    return conn
+
+
+def _fts_prefix_query(term: str) -> str:
+    """Turn free text into an FTS5 query matching each word as a prefix.
+
+    "bob sm" matches "Bob Smith". Words are quoted so that FTS5 operators
+    and punctuation in the input are treated literally.
+    """
+    words = [w.replace('"', '""') for w in term.split()]
+    return " ".join(f'"{w}"*' for w in words)
@@ -10,10 +10,10 @@ import uvicorn
 from fastapi import FastAPI
 
 from . import config
-from .chat_api import list_messages
+from .chat_api import iter_message_pages
 from .db import Database
 from .poller import Poller
-from .routes import router
+from .routes import invalidate_response_cache, router
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,16 +27,33 @@ def poll_fn(db: Database) -> int:
 
     Returns the number of newly inserted messages.
     """
-    latest = db.latest_message_time()
-    after = datetime.fromisoformat(latest) if latest else None
+    # Cursor is the newest createTime seen by the last successful poll, as
+    # returned by the API, so it drops straight into the list filter.
+    # Database seeds it for databases from before the cursor existed.
+    after = db.get_state("last_created_at")
+    etag = db.get_state("list_etag")
+    pages = iter_message_pages(db, after=after, etag=etag)
+    new_count = 0
+    newest: str | None = None
     try:
-        messages = list_messages(db, after=after)
+        for page in pages:
+            inserted, page_newest = db.upsert_messages(page)
+            new_count += inserted
+            newest = max(
+                filter(None, (newest, page_newest)), key=datetime.fromisoformat
+            )
     except RuntimeError:
         # Not authenticated yet — skip silently
         return 0
-    if not messages:
-        return 0
-    return db.upsert_messages(messages)
+    # Only advance the cursor and ETag once every page has been stored, so a
+    # poll that fails part-way is retried in full rather than answered 304
+    if newest:
+        db.set_state("last_created_at", newest)
+    if pages.etag and pages.etag != etag:
+        db.set_state("list_etag", pages.etag)
+    if new_count > 0:
+        invalidate_response_cache()
+    return new_count
 
 
 @asynccontextmanager
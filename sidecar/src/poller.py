@@ -2,9 +2,12 @@
 
 State machine:
     IDLE  ──(skill call)──►  ACTIVE
-    (4h)                     (30-60s)
+    (4h)                     (30-120s)
      ▲                          │
      └──(10min no calls)────────┘
+
+A second background task keeps the OAuth access token fresh so that
+request handlers rarely have to refresh it inline.
 """
 
 from __future__ import annotations
@@ -16,9 +19,24 @@ from datetime import datetime, timezone
 from enum import Enum
 
 from . import config
+from .auth import load_credentials, seconds_until_refresh
 
 log = logging.getLogger(__name__)
 
+# How often to re-check for credentials before OAuth has been completed,
+# or after a failed refresh.
+TOKEN_RECHECK_INTERVAL = 60
+
+# ACTIVE interval grows by this factor after each poll that finds nothing
+ACTIVE_BACKOFF_FACTOR = 1.5
+
+# Minimum seconds between writes of last_poll_at to the database; the
+# exact value is kept in memory on Poller.last_poll_at.
+LAST_POLL_PERSIST_INTERVAL = 60
+
+# Seconds between retention passes when MESSAGE_RETENTION_DAYS is set
+PRUNE_INTERVAL = 86400
+
 
 class PollMode(str, Enum):
     IDLE = "idle"
@@ -39,7 +57,12 @@ class Poller:
         self.poll_fn = poll_fn
         self._mode = PollMode.IDLE
         self._last_skill_touch: float = 0.0
+        self._empty_streak = 0
+        self.last_poll_at: str | None = None
+        self._last_persisted_poll_ts: float = 0.0
         self._task: asyncio.Task | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._inflight: asyncio.Task[int] | None = None
 
     @property
     def mode(self) -> str:
@@ -51,14 +74,22 @@ class Poller:
         if self._mode != PollMode.ACTIVE:
             log.info("Polling boosted to ACTIVE")
             self._mode = PollMode.ACTIVE
+            self._empty_streak = 0
 
     async def start(self) -> None:
         """Start the background polling loop."""
         self._task = asyncio.create_task(self._loop())
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
         log.info("Poller started in %s mode", self._mode.value)
 
     async def stop(self) -> None:
-        """Cancel the background task."""
+        """Cancel the background tasks."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
         if self._task:
             self._task.cancel()
             try:
@@ -66,12 +97,11 @@ class Poller:
             except asyncio.CancelledError:
                 pass
             log.info("Poller stopped")
+        if self._inflight:
+            self._inflight.cancel()
 
     async def _loop(self) -> None:
         while True:
-            # Determine current interval
-            interval = self._current_interval()
-
             # Check for decay: ACTIVE → IDLE after timeout
             if self._mode == PollMode.ACTIVE and self._last_skill_touch > 0:
                 elapsed = time.monotonic() - self._last_skill_touch
@@ -81,23 +111,108 @@ class Poller:
                         int(elapsed),
                     )
                     self._mode = PollMode.IDLE
-                    interval = config.POLL_IDLE_INTERVAL
 
-            # Poll
+            new_count = await self.poll_now()
+            # Only scheduled polls drive the backoff; off-schedule callers of
+            # poll_now() shouldn't stretch the interval
+            if new_count is not None:
+                self._update_backoff(new_count)
+
+            if config.MESSAGE_RETENTION_DAYS > 0:
+                try:
+                    await self._maybe_prune()
+                except Exception:
+                    log.exception("Message pruning failed")
+
+            # Pick the interval only now, so it reflects this poll's result
+            # (and any decay to IDLE above)
+            await asyncio.sleep(self._current_interval())
+
+    async def poll_now(self) -> int | None:
+        """Poll immediately, or join the poll already in progress.
+
+        Returns the number of new messages, or None if the poll failed.
+        """
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._poll_once())
+            self._inflight.add_done_callback(self._clear_inflight)
+        # Shield so a cancelled caller doesn't abort the shared poll
+        return await asyncio.shield(self._inflight)
+
+    def _clear_inflight(self, task: asyncio.Task) -> None:
+        if self._inflight is task:
+            self._inflight = None
+
+    async def _poll_once(self) -> int | None:
+        try:
+            new_count = await asyncio.to_thread(self.poll_fn, self.db)
+        except Exception:
+            log.exception("Poll cycle failed")
+            return None
+
+        self._record_poll()
+        if new_count > 0:
+            log.info("Fetched %d new message(s)", new_count)
+        return new_count
+
+    def _update_backoff(self, new_count: int) -> None:
+        """Grow the ACTIVE interval after an empty poll, reset it otherwise."""
+        if new_count > 0:
+            self._empty_streak = 0
+        elif (
+            self._mode == PollMode.ACTIVE
+            and self._current_interval() < config.POLL_ACTIVE_MAX_INTERVAL
+        ):
+            self._empty_streak += 1
+
+    def _record_poll(self) -> None:
+        """Note the poll time in memory, persisting it at most once a minute."""
+        self.last_poll_at = datetime.now(timezone.utc).isoformat()
+        now = time.monotonic()
+        if now - self._last_persisted_poll_ts >= LAST_POLL_PERSIST_INTERVAL:
+            self.db.set_state("last_poll_at", self.last_poll_at)
+            self._last_persisted_poll_ts = now
+
+    async def _maybe_prune(self) -> None:
+        """Apply the retention policy if it has not run in the last day."""
+        last = self.db.get_state("last_prune_at")
+        now = datetime.now(timezone.utc)
+        if last:
+            elapsed = (now - datetime.fromisoformat(last)).total_seconds()
+            if elapsed < PRUNE_INTERVAL:
+                return
+        deleted = await asyncio.to_thread(
+            self.db.prune, config.MESSAGE_RETENTION_DAYS
+        )
+        self.db.set_state("last_prune_at", now.isoformat())
+        if deleted > 0:
+            log.info(
+                "Pruned %d message(s) older than %d days",
+                deleted,
+                config.MESSAGE_RETENTION_DAYS,
+            )
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the access token shortly before it expires."""
+        while True:
             try:
-                new_count = await asyncio.to_thread(self.poll_fn, self.db)
-                self.db.set_state(
-                    "last_poll_at",
-                    datetime.now(timezone.utc).isoformat(),
-                )
-                if new_count > 0:
-                    log.info("Fetched %d new message(s)", new_count)
+                # Refreshes (under the auth lock) only if the token is stale
+                await asyncio.to_thread(load_credentials, self.db)
+                delay = seconds_until_refresh()
             except Exception:
-                log.exception("Poll cycle failed")
+                log.exception("Background token refresh failed")
+                delay = None
 
-            await asyncio.sleep(interval)
+            if delay is None:
+                delay = TOKEN_RECHECK_INTERVAL
+            await asyncio.sleep(max(delay, 1.0))
 
-    def _current_interval(self) -> int:
+    def _current_interval(self) -> float:
         if self._mode == PollMode.ACTIVE:
-            return config.POLL_ACTIVE_INTERVAL
+            # Back off while ACTIVE polls keep coming back empty
+            backoff = ACTIVE_BACKOFF_FACTOR ** self._empty_streak
+            return min(
+                config.POLL_ACTIVE_INTERVAL * backoff,
+                max(config.POLL_ACTIVE_MAX_INTERVAL, config.POLL_ACTIVE_INTERVAL),
+            )
         return config.POLL_IDLE_INTERVAL
@@ -3,20 +3,35 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from . import config
-from .auth import build_consent_url, exchange_code
+from .auth import (
+    build_consent_url,
+    exchange_code,
+    invalidate as invalidate_credentials,
+)
 from .chat_api import get_space_info, send_message as api_send_message
 
 log = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds to reuse a computed /status or /messages/unread response, so
+# dashboards polling at 1Hz don't hit SQLite on every request.
+RESPONSE_CACHE_TTL = 1.0
+
+_response_cache: dict[str, tuple[float, Any]] = {}
+
+# Bumped on every invalidation, so a rebuild that overlapped one is not cached
+_response_cache_generation = 0
+
 
 # ---------- Pydantic models ----------
 
@@ -42,17 +57,22 @@ def get_messages(
 
 
 @router.get("/messages/unread")
-def get_unread(request: Request) -> dict[str, Any]:
+async def get_unread(request: Request) -> dict[str, Any]:
     _touch_skill(request)
     db = request.app.state.db
-    messages = db.get_unread_messages()
-    return {"count": len(messages), "messages": messages}
+
+    def build() -> dict[str, Any]:
+        messages = db.get_unread_messages()
+        return {"count": len(messages), "messages": messages}
+
+    return await _cached("/messages/unread", build)
 
 
 @router.post("/messages/mark-read")
 def mark_read(request: Request, body: MarkReadBody | None = None) -> dict[str, str]:
     ts = body.timestamp if body else None
     marker = request.app.state.db.mark_read(ts)
+    invalidate_response_cache()
     return {"read_marker": marker}
 
 
@@ -66,6 +86,7 @@ def send_chat_message(request: Request, body: SendBody) -> dict[str, Any]:
         raise HTTPException(status_code=503, detail=str(exc))
     # Also store the sent message locally
     db.upsert_messages([{**msg, "fetched_at": datetime.now(timezone.utc).isoformat()}])
+    invalidate_response_cache()
     return {"status": "sent", "message": msg}
 
 
@@ -80,17 +101,23 @@ def boost_polling(request: Request) -> dict[str, str]:
 # ---------- Status ----------
 
 @router.get("/status")
-def status(request: Request) -> dict[str, Any]:
+async def status(request: Request) -> dict[str, Any]:
     db = request.app.state.db
     poller = request.app.state.poller
-    return {
-        "authenticated": db.get_auth("refresh_token") is not None,
-        "space_id": config.GOOGLE_CHAT_SPACE_ID,
-        "poll_mode": poller.mode if poller else "unknown",
-        "last_poll_at": db.get_state("last_poll_at"),
-        "message_count": db.message_count(),
-        "unread_count": db.unread_count(),
-    }
+
+    def build() -> dict[str, Any]:
+        # The poller only persists last_poll_at once a minute; prefer its copy
+        last_poll_at = poller.last_poll_at if poller else None
+        return {
+            "authenticated": db.get_auth("refresh_token") is not None,
+            "space_id": config.GOOGLE_CHAT_SPACE_ID,
+            "poll_mode": poller.mode if poller else "unknown",
+            "last_poll_at": last_poll_at or db.get_state("last_poll_at"),
+            "message_count": db.message_count(),
+            "unread_count": db.unread_count(),
+        }
+
+    return await _cached("/status", build)
 
 
 # ---------- Auth ----------
@@ -117,12 +144,42 @@ def auth_callback(request: Request, code: str = Query(...)) -> dict[str, str]:
     db.set_auth("refresh_token", tokens["refresh_token"])
     db.set_auth("access_token", tokens["access_token"])
     db.set_auth("token_expiry", tokens["token_expiry"])
+    invalidate_credentials()
+    invalidate_response_cache()
 
     return {"status": "authenticated", "message": "OAuth setup complete. You can close this tab."}
 
 
 # ---------- Internal helpers ----------
 
+def invalidate_response_cache() -> None:
+    """Drop cached responses after messages or the read marker change."""
+    global _response_cache_generation
+    _response_cache_generation += 1
+    _response_cache.clear()
+
+
+async def _cached(key: str, build: Callable[[], Any]) -> Any:
+    """Return the cached response for `key`, rebuilding it once stale.
+
+    Hits are served straight from the event loop; only a rebuild, which
+    queries SQLite, is pushed to the threadpool.
+    """
+    now = time.monotonic()
+    hit = _response_cache.get(key)
+    if hit is not None and now - hit[0] < RESPONSE_CACHE_TTL:
+        return hit[1]
+    generation = _response_cache_generation
+    value = await run_in_threadpool(build)
+    # If the cache was invalidated while we were reading, the value may
+    # predate that change: return it to this caller but don't cache it.
+    # Stamped with the pre-read time, so its TTL counts from when the
+    # data was read.
+    if generation == _response_cache_generation:
+        _response_cache[key] = (now, value)
+    return value
+
+
 def _touch_skill(request: Request) -> None:
     """Record that the skill made a request — used by the poller to boost."""
     poller = request.app.state.poller